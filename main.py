@@ -1,6 +1,12 @@
 import os
 import re
+import csv
+import tempfile
 import logging
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import pdfplumber
 import pandas as pd
 import mysql.connector
@@ -16,39 +22,69 @@ load_dotenv()
 ignore_keywords = os.getenv('IGNORE_KEYWORDS', '').split(',')
 types = os.getenv('TYPES', '').split(',')
 
-# Set up logging with a unique file name based on timestamp
-log_filename = f'logs/project_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
-if not os.path.exists('logs'):
-    os.makedirs('logs')
-
-# Set up logging to file
-logging.basicConfig(
-    filename=log_filename,
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+# Lowercased types, paired with the original names, for matching against file paths
+lower_types = [(doc_type.lower(), doc_type) for doc_type in types if doc_type]
+
+# Format of the extracted data files: 'xlsx' (default) or 'parquet' (requires pyarrow)
+OUTPUT_FORMATS = ('xlsx', 'parquet')
+output_format = os.getenv('OUTPUT_FORMAT', 'xlsx').strip().lower()
+
+# Output columns, in the same order as the MySQL table columns
+COLUMNS = [
+    "Nome Completo",
+    "Parent 1",
+    "Parent 2",
+    "Data de Nascimento",
+    "Concelho",
+    "Posto",
+    "Type",
+    "File Name"
+]
+
+# Regular expressions used while parsing the PDF text
+DATE_RE = re.compile(r'(\d{2}-\d{2}-\d{4})')
+CONCELHO_RE = re.compile(
+    r'Concelho\s*:\s*([\w\sçÇáéíóúàèìòùãõâêîôûäëïöüÄËÏÖÜñÑ]+)\s*'
+    r'Posto\s*:\s*([\w\sçÇáéíóúàèìòùãõâêîôûäëïöüÄËÏÖÜñÑ-]+)',
+    re.UNICODE
 )
 
-def extract_name_and_date(text):
+# Single pattern matching any of the ignore keywords in a file name
+ignore_keywords_re = re.compile(
+    '|'.join(re.escape(keyword) for keyword in ignore_keywords if keyword),
+    re.IGNORECASE
+) if any(ignore_keywords) else None
+
+# Number of rows sent to MySQL per executemany call
+INSERT_CHUNK_SIZE = 10_000
+
+# PDFs with more rows than this are loaded with LOAD DATA LOCAL INFILE instead of INSERTs
+BULK_LOAD_THRESHOLD = 5000
+
+# Number of pages searched for the Concelho/Posto header before giving up
+MAX_HEADER_PROBES = 2
+
+# Number of PDFs inserted between commits
+COMMIT_EVERY_PDFS = 10
+
+# Maximum number of PDFs waiting to be inserted by the database thread
+MAX_PENDING_INSERTS = 8
+
+def setup_logging(log_filename):
     """
-    Extracts the name and date from the given text using regular expressions.
+    Sets up logging to the given file.
 
-    Args:
-        text (str): The input text containing the name and date.
+    Also used as the worker initializer of the process pool, so workers started with the
+    spawn method log to the same file as the main process.
 
-    Returns:
-        tuple: A tuple containing the name and date if found, otherwise (text, None).
+    Args:
+        log_filename (str): The path of the log file.
     """
-    try:
-        date_pattern = r'\d{2}-\d{2}-\d{4}'
-        match = re.search(date_pattern, text)
-        if match:
-            date = match.group()
-            name = text.replace(date, '').strip()
-            return name, date
-        return text, None
-    except Exception as e:
-        logging.error(f"Error in extract_name_and_date: {e}")
-        return text, None
+    logging.basicConfig(
+        filename=log_filename,
+        level=logging.DEBUG,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
 
 def extract_concelho_and_posto(page_text):
     """
@@ -61,11 +97,7 @@ def extract_concelho_and_posto(page_text):
         tuple: A tuple containing the 'Concelho' and 'Posto' values if found, otherwise (None, None).
     """
     try:
-        concelho_pattern = (
-            r'Concelho\s*:\s*([\w\sçÇáéíóúàèìòùãõâêîôûäëïöüÄËÏÖÜñÑ]+)\s*'
-            r'Posto\s*:\s*([\w\sçÇáéíóúàèìòùãõâêîôûäëïöüÄËÏÖÜñÑ-]+)'
-        )
-        match = re.search(concelho_pattern, page_text, re.UNICODE)
+        match = CONCELHO_RE.search(page_text)
 
         if match:
             concelho = match.group(1).strip()
@@ -76,6 +108,29 @@ def extract_concelho_and_posto(page_text):
         logging.error(f"Error in extract_concelho_and_posto: {e}")
         return None, None
 
+def chunks(items, size):
+    """
+    Splits a list into consecutive slices of at most the given size.
+
+    Args:
+        items (list): The list to split.
+        size (int): The maximum number of items per slice.
+
+    Returns:
+        generator: A generator yielding the slices.
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def new_columns():
+    """
+    Creates an empty column-oriented container for the extracted rows.
+
+    Returns:
+        dict: A dictionary mapping each column name to an empty list.
+    """
+    return {column: [] for column in COLUMNS}
+
 def determine_type(file_name):
     """
     Determines the type of document based on the file name.
@@ -88,8 +143,8 @@ def determine_type(file_name):
     """
     try:
         lower_file_name = file_name.lower()
-        for doc_type in types:
-            if doc_type.lower() in lower_file_name:
+        for lower_type, doc_type in lower_types:
+            if lower_type in lower_file_name:
                 return doc_type
         return 'unknown'
     except Exception as e:
@@ -104,109 +159,132 @@ def extract_tables_from_pdf(pdf_path):
         pdf_path (str): The path to the PDF file.
 
     Returns:
-        tuple: A tuple containing the extracted data, 'Concelho', and 'Posto' values.
+        tuple: A tuple containing the extracted data (a dictionary of column lists), 'Concelho', and 'Posto' values.
     """
-    data = []
+    cells = {"Cell": [], "Concelho": [], "Posto": []}
     concelho, posto = None, None
+    header_probes = 0
+    # Shared by every row of the PDF, so computed once
     file_type = determine_type(pdf_path)
+    file_name = os.path.basename(pdf_path)
 
     try:
         with pdfplumber.open(pdf_path) as pdf:
+            total_pages = len(pdf.pages)
             for i, page in enumerate(pdf.pages):
-                logging.info(f"Extracting data from page {i + 1}/{len(pdf.pages)} of {pdf_path}")
-                if not concelho or not posto:
+                logging.info("Extracting data from page %d/%d of %s", i + 1, total_pages, pdf_path)
+                # Full-page text extraction is expensive, so stop probing after a few pages without the header
+                if (not concelho or not posto) and header_probes < MAX_HEADER_PROBES:
+                    header_probes += 1
                     page_text = page.extract_text()
                     concelho, posto = extract_concelho_and_posto(page_text)
                     logging.info(f"Extracted Concelho: {concelho}, Posto: {posto}")
 
                 tables = page.extract_tables()
-                logging.info(f"Found {len(tables)} tables on page {i + 1}")
+                logging.info("Found %d tables on page %d", len(tables), i + 1)
 
                 for table in tables:
-                    data.extend(process_table(table, concelho, posto, file_type, pdf_path))
+                    process_table(table, concelho, posto, cells)
     except Exception as e:
         logging.error(f"Error in extract_tables_from_pdf: {e}")
 
+    try:
+        data = parse_cells(cells, file_type, file_name)
+    except Exception as e:
+        logging.error(f"Error in parse_cells: {e}")
+        data = new_columns()
+
     return data, concelho, posto
 
-def process_table(table, concelho, posto, file_type, pdf_path):
+def process_one_pdf(pdf_path):
     """
-    Processes a table extracted from a PDF file.
+    Worker entry point that extracts the data from a single PDF file.
 
     Args:
-        table (list): The table data.
-        concelho (str): The 'Concelho' value.
-        posto (str): The 'Posto' value.
-        file_type (str): The type of document.
         pdf_path (str): The path to the PDF file.
 
     Returns:
-        list: A list of dictionaries containing the processed data.
+        tuple: A tuple containing the extracted data, 'Concelho', 'Posto' and the PDF path.
+    """
+    data, concelho, posto = extract_tables_from_pdf(pdf_path)
+    return data, concelho, posto, pdf_path
+
+def process_table(table, concelho, posto, cells):
+    """
+    Collects the raw name/parents/date cells of a table extracted from a PDF file.
+
+    Args:
+        table (list): The table data.
+        concelho (str): The 'Concelho' value.
+        posto (str): The 'Posto' value.
+        cells (dict): The 'Cell', 'Concelho' and 'Posto' lists to which the rows are appended.
     """
-    data = []
     try:
         for row in table:
-            if row[0] == 'NOME COMPLETO FILIAÇÃO DATA NASC.º':
-                continue  # Skip header row
-
-            cells = row[0].split('\n')
+            cell = row[0]
+            if cell is None or cell == 'NOME COMPLETO FILIAÇÃO DATA NASC.º':
+                continue  # Skip empty and header rows
 
-            if len(cells) < 2:
+            if '\n' not in cell:
                 continue  # Skip rows that don't have at least name and one parent
 
-            parent_1, date_in_parent_1 = extract_name_and_date(cells[0].strip())  # Swap: this is actually "Nome Completo"
-            nome_completo, parent_2, data_nascimento = process_cells(cells, parent_1, date_in_parent_1)
-
-            row_dict = {
-                "Nome Completo": nome_completo,
-                "Parent 1": parent_1,
-                "Parent 2": parent_2,
-                "Data de Nascimento": data_nascimento,
-                "Concelho": concelho,
-                "Posto": posto,
-                "Type": file_type,
-                "File Name": os.path.basename(pdf_path)
-            }
-            data.append(row_dict)
+            cells["Cell"].append(cell)
+            cells["Concelho"].append(concelho)
+            cells["Posto"].append(posto)
     except Exception as e:
         logging.error(f"Error in process_table: {e}")
 
-    return data
-
-def process_cells(cells, parent_1, date_in_parent_1):
+def parse_cells(cells, file_type, file_name):
     """
-    Processes individual cells in a table row.
+    Splits the raw table cells into name, parents and date of birth using vectorized pandas string operations.
+
+    Each cell holds one value per line: the first line is a parent (or the full name), a line with
+    a date holds the full name, and any other line holds the second parent.
 
     Args:
-        cells (list): The list of cells in the row.
-        parent_1 (str): The first parent name.
-        date_in_parent_1 (str): The date found in the first parent cell.
+        cells (dict): The 'Cell', 'Concelho' and 'Posto' lists collected by process_table.
+        file_type (str): The type of document.
+        file_name (str): The name of the PDF file.
 
     Returns:
-        tuple: A tuple containing the full name, second parent name, and date of birth.
+        dict: The processed data, as a dictionary of column lists.
     """
-    nome_completo = ""
-    parent_2 = ""
-    data_nascimento = date_in_parent_1 or ""
-
-    try:
-        for cell in cells[1:]:
-            cell = cell.strip()
-            name, date = extract_name_and_date(cell)
-            if date:
-                data_nascimento = date
-                nome_completo = name
-            else:
-                parent_2 = name
-
-        if not nome_completo:
-            nome_completo = parent_1
-            parent_1 = parent_2
-            parent_2 = ""
-    except Exception as e:
-        logging.error(f"Error in process_cells: {e}")
-
-    return nome_completo, parent_2, data_nascimento
+    data = new_columns()
+    if not cells["Cell"]:
+        return data
+
+    rows = pd.DataFrame(cells)
+    # The date pattern has no surrounding whitespace and names are stripped after removing the
+    # date, so the lines can be used as split without stripping them first
+    lines = rows["Cell"].str.split('\n').explode()
+    position = lines.groupby(level=0).cumcount()
+    # Only the first date of a line is taken, and only that one is removed from the name
+    dates = lines.str.extract(DATE_RE, expand=False)
+    names = lines.str.replace(DATE_RE, '', n=1, regex=True).str.strip()
+
+    first = position == 0
+    dated = ~first & dates.notna()
+    undated = ~first & dates.isna()
+
+    # Swap: the first line is actually "Nome Completo" unless a later line holds the date
+    parent_1 = names[first]
+    nome_completo = names[dated].groupby(level=0).last().reindex(rows.index)
+    parent_2 = names[undated].groupby(level=0).last().reindex(rows.index)
+    parent_2 = parent_2.where(parent_2.notna(), '')
+    data_nascimento = dates[dated].groupby(level=0).last().reindex(rows.index)
+    data_nascimento = data_nascimento.where(data_nascimento.notna(), dates[first])
+    data_nascimento = data_nascimento.where(data_nascimento.notna(), '')
+
+    missing_nome = nome_completo.isna() | (nome_completo == '')
+    data["Nome Completo"] = nome_completo.where(~missing_nome, parent_1).tolist()
+    data["Parent 1"] = parent_1.tolist()
+    data["Parent 2"] = parent_2.where(~missing_nome, '').tolist()
+    data["Data de Nascimento"] = data_nascimento.tolist()
+    data["Concelho"] = cells["Concelho"]
+    data["Posto"] = cells["Posto"]
+    data["Type"] = [file_type] * len(rows)
+    data["File Name"] = [file_name] * len(rows)
+    return data
 
 def create_database_and_table(cursor, db_name, table_name):
     """
@@ -262,49 +340,242 @@ def check_mysql_connection(db_config):
         logging.error(f"Error connecting to MySQL: {e}")
     return False
 
-def insert_data_into_mysql(data, db_config, table_name):
+class DbWriter:
     """
-    Inserts extracted data into a MySQL database table.
+    Inserts extracted data into a MySQL database table over a single connection.
 
-    Args:
-        data (list): The extracted data to be inserted.
-        db_config (dict): The database configuration containing host, user, password, and database name.
-        table_name (str): The name of the table.
+    The connection is opened and the schema created once when entering the context.
+    Large PDFs are bulk loaded from a temporary CSV file with LOAD DATA LOCAL INFILE.
+    Inserts are committed every `commit_every` PDFs and when leaving the context.
     """
-    try:
-        conn = mysql.connector.connect(
-            host=db_config['host'],
-            user=db_config['user'],
-            password=db_config['password'],
-            database=db_config['database']
-        )
-        cursor = conn.cursor()
-
-        create_database_and_table(cursor, db_config['database'], table_name)
 
-        insert_query = f"""
+    def __init__(self, db_config, table_name, commit_every=COMMIT_EVERY_PDFS):
+        """
+        Args:
+            db_config (dict): The database configuration containing host, user, password, and database name.
+            table_name (str): The name of the table.
+            commit_every (int): The number of inserted PDFs between commits.
+        """
+        self.db_config = db_config
+        self.table_name = table_name
+        self.commit_every = commit_every
+        self.conn = None
+        self.cursor = None
+        self.pending = 0
+        self.bulk_load = True
+        self.load_query = f"""
+        LOAD DATA LOCAL INFILE %s INTO TABLE {table_name}
+        CHARACTER SET utf8mb4
+        FIELDS TERMINATED BY ',' ENCLOSED BY '"' ESCAPED BY ''
+        LINES TERMINATED BY '\\n'
+        (nome_completo, parent_1, parent_2, data_nascimento, @concelho, @posto, type, file_name)
+        SET concelho = NULLIF(@concelho, ''), posto = NULLIF(@posto, '')
+        """
+        self.insert_query = f"""
         INSERT INTO {table_name} (
             nome_completo, parent_1, parent_2, data_nascimento, concelho, posto, type, file_name
         ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
         """
 
-        for row in data:
-            cursor.execute(insert_query, (
-                row["Nome Completo"],
-                row["Parent 1"],
-                row["Parent 2"],
-                row["Data de Nascimento"],
-                row["Concelho"],
-                row["Posto"],
-                row["Type"],
-                row["File Name"]
-            ))
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+    def __enter__(self):
+        self.conn = mysql.connector.connect(
+            host=self.db_config['host'],
+            user=self.db_config['user'],
+            password=self.db_config['password'],
+            database=self.db_config['database'],
+            # Only our own temporary CSV files may be sent, not any file the server asks for
+            allow_local_infile_in_path=tempfile.gettempdir()
+        )
+        self.cursor = self.conn.cursor()
+        create_database_and_table(self.cursor, self.db_config['database'], self.table_name)
+        self.conn.autocommit = False
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.conn.rollback()
+        finally:
+            self.cursor.close()
+            self.conn.close()
+
+    def insert(self, data):
+        """
+        Inserts the data extracted from one PDF file.
+
+        Args:
+            data (dict): The extracted data to be inserted, as a dictionary of column lists.
+        """
+        rows = list(zip(*(data[column] for column in COLUMNS)))
+        if not rows:
+            return
+
+        # The savepoint lets a failed PDF be undone without losing the uncommitted ones before it
+        self.cursor.execute("SAVEPOINT pdf_insert")
+        try:
+            if self.bulk_load and len(rows) > BULK_LOAD_THRESHOLD:
+                self.load_rows(rows)
+            else:
+                self.insert_rows(rows)
+        except Exception as e:
+            logging.error(f"Error in DbWriter.insert: {e}")
+            self.cursor.execute("ROLLBACK TO SAVEPOINT pdf_insert")
+            return
+
+        self.pending += 1
+        if self.pending >= self.commit_every:
+            self.commit()
+
+    def insert_rows(self, rows):
+        """
+        Inserts rows with batched INSERT statements.
+
+        Args:
+            rows (list): The rows to insert, as tuples in COLUMNS order.
+        """
+        # executemany turns each chunk into a multi-row INSERT instead of one round-trip per row
+        for chunk in chunks(rows, INSERT_CHUNK_SIZE):
+            self.cursor.executemany(self.insert_query, chunk)
+
+    def load_rows(self, rows):
+        """
+        Loads rows with LOAD DATA LOCAL INFILE, which skips per-row SQL parsing.
+
+        Falls back to insert_rows, and stops bulk loading, if the server does not allow it.
+        LOAD DATA LOCAL turns errors such as truncated values into warnings, so any warning
+        raises an exception to roll the PDF back, as a failed INSERT would.
+
+        Args:
+            rows (list): The rows to insert, as tuples in COLUMNS order.
+        """
+        csv_file = tempfile.NamedTemporaryFile('w', suffix='.csv', newline='', encoding='utf-8', delete=False)
+        try:
+            # The file holds personal data, so it is removed even if writing it fails.
+            # Every value is quoted so a literal NULL is not loaded as SQL NULL
+            with csv_file:
+                csv.writer(csv_file, lineterminator='\n', quoting=csv.QUOTE_ALL).writerows(rows)
+            try:
+                self.cursor.execute(self.load_query, (csv_file.name,))
+            except Error as e:
+                logging.warning(f"LOAD DATA LOCAL INFILE failed, using INSERT statements instead: {e}")
+                self.bulk_load = False
+                self.insert_rows(rows)
+                return
+            if self.cursor.warning_count:
+                raise ValueError(f"LOAD DATA LOCAL INFILE produced {self.cursor.warning_count} warnings")
+        finally:
+            os.remove(csv_file.name)
+
+    def commit(self):
+        """
+        Commits the pending inserts.
+        """
+        self.conn.commit()
+        self.pending = 0
+
+def check_output_format():
+    """
+    Checks that OUTPUT_FORMAT is supported and that its writer library is installed.
+
+    Returns:
+        str: An error message if the format can't be used, otherwise None.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        return f"Unsupported OUTPUT_FORMAT '{output_format}', use one of: {', '.join(OUTPUT_FORMATS)}."
+    if output_format == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return "OUTPUT_FORMAT is parquet but pyarrow is not installed (pip install pyarrow)."
+    return None
+
+def save_data_to_file(data, pdf_path):
+    """
+    Saves the extracted data next to the PDF file, as Excel or Parquet according to OUTPUT_FORMAT.
+
+    Args:
+        data (dict): The extracted data, as a dictionary of column lists.
+        pdf_path (str): The path to the PDF file.
+
+    Returns:
+        str: The path of the written file.
+    """
+    df = pd.DataFrame(data, columns=COLUMNS)
+    base_path = os.path.splitext(pdf_path)[0]
+    if output_format == 'parquet':
+        output_file_path = f'{base_path}.parquet'
+        df.to_parquet(output_file_path, index=False, compression='zstd')
+    else:
+        # xlsxwriter is much faster than the default openpyxl engine. constant_memory mode can't be
+        # used: pandas writes column by column, and that mode drops cells written to flushed rows
+        output_file_path = f'{base_path}.xlsx'
+        df.to_excel(output_file_path, index=False, engine='xlsxwriter')
+    return output_file_path
+
+def take_slots(items, slots):
+    """
+    Yields the items, taking a slot from the semaphore before each one.
+
+    Used to feed the process pool, so only a bounded number of PDFs are parsed, waiting
+    in the pool's results or waiting to be inserted at the same time.
+
+    Args:
+        items (iterable): The items to yield.
+        slots (threading.BoundedSemaphore): The semaphore limiting the items in flight.
+
+    Returns:
+        generator: A generator yielding the items.
+    """
+    for item in items:
+        slots.acquire()
+        yield item
+
+def wait_for_insert(future, pdf_path, slots):
+    """
+    Waits for a background insert to finish, logs its failure and frees the PDF's slot.
+
+    Args:
+        future (concurrent.futures.Future): The future of the DbWriter.insert call.
+        pdf_path (str): The path to the PDF file whose data was inserted.
+        slots (threading.BoundedSemaphore): The semaphore limiting the PDFs in flight.
+    """
+    try:
+        future.result()
     except Exception as e:
-        logging.error(f"Error in insert_data_into_mysql: {e}")
+        logging.error(f"Error inserting data from {pdf_path}: {e}")
+    finally:
+        slots.release()
+
+def iter_pdf_files(folder):
+    """
+    Recursively yields the PDF files in a folder and its subfolders, ignoring files with specified keywords.
+
+    Uses os.scandir, whose directory entries already carry the file type, so no extra stat call
+    is needed per entry. Symbolic links to folders are not followed.
+
+    Args:
+        folder (str): The folder to search.
+
+    Returns:
+        generator: A generator yielding the paths to the PDF files.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        yield from iter_pdf_files(entry.path)
+                    continue
+                lower_filename = entry.name.lower()
+                if not lower_filename.endswith('.pdf'):
+                    continue
+                if ignore_keywords_re is not None and ignore_keywords_re.search(lower_filename):
+                    continue
+                yield entry.path
+    except OSError as e:
+        logging.error(f"Error in iter_pdf_files: {e}")
 
 def find_pdf_files(root_folder):
     """
@@ -316,23 +587,22 @@ def find_pdf_files(root_folder):
     Returns:
         list: A list of paths to PDF files.
     """
-    pdf_files = []
-    ignore_keywords = os.getenv('IGNORE_KEYWORDS', '').split(',')
-
     try:
-        for dirpath, _, filenames in os.walk(root_folder):
-            for filename in filenames:
-                if filename.lower().endswith('.pdf') and not any(keyword.lower() in filename.lower() for keyword in ignore_keywords):
-                    pdf_files.append(os.path.join(dirpath, filename))
+        return list(iter_pdf_files(root_folder))
     except Exception as e:
         logging.error(f"Error in find_pdf_files: {e}")
-
-    return pdf_files
+        return []
 
 def main():
     """
     Main function to process PDF files, extract data, and insert it into a MySQL database.
     """
+    # Set up logging with a unique file name based on timestamp
+    log_filename = f'logs/project_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+    if not os.path.exists('logs'):
+        os.makedirs('logs')
+    setup_logging(log_filename)
+
     # Database configuration
     db_config = {
         'host': os.getenv('DB_HOST'),
@@ -342,6 +612,13 @@ def main():
     }
     table_name = os.getenv('DB_TABLE')
 
+    # Check the output file format
+    output_format_error = check_output_format()
+    if output_format_error:
+        print(f"❌ {output_format_error}")
+        logging.error(f"{output_format_error} Process stopped.")
+        return
+
     # Check MySQL connection
     if not check_mysql_connection(db_config):
         print("❌ Unable to connect to the MySQL database. Please check your configuration.")
@@ -356,27 +633,46 @@ def main():
     pdf_files = find_pdf_files(root_folder)
     logging.info(f"Found {len(pdf_files)} PDF files to process")
 
-    # Option to save data to Excel
-    save_to_excel = input("Extrair dados para excel? (sim/não): ").strip().lower() == 'sim'
-
-    # Process each PDF file
-    for pdf_path in tqdm(pdf_files, desc="Processing PDFs", unit="file"):
-        try:
-            data, concelho, posto = extract_tables_from_pdf(pdf_path)
-            logging.info(f"Total extracted entries from {pdf_path}: {len(data)}")
-            insert_data_into_mysql(data, db_config, table_name)
-            logging.info(f"Concelho: {concelho}, Posto: {posto}")
-
-            # Save data to Excel file if the option is selected
-            if save_to_excel and data:
-                df = pd.DataFrame(data)
-                output_file_path = f'{os.path.splitext(pdf_path)[0]}.xlsx'
-                df.to_excel(output_file_path, index=False)
-                logging.info(f'Data extracted and saved to {output_file_path}')
-            else:
-                logging.info(f"No data extracted from {pdf_path}.")
-        except Exception as e:
-            logging.error(f"Error processing {pdf_path}: {e}")
+    # Option to save data to a file in OUTPUT_FORMAT
+    save_to_file = input(f"Extrair dados para ficheiro {output_format}? (sim/não): ").strip().lower() == 'sim'
+
+    # Parse the PDF files in parallel and insert them from a single database thread, so the MySQL
+    # round-trips overlap with collecting the results and writing the output files. The pool is
+    # started before connecting so the workers don't inherit the MySQL socket
+    with multiprocessing.Pool(os.cpu_count(), initializer=setup_logging, initargs=(log_filename,)) as pool, \
+            DbWriter(db_config, table_name) as writer, \
+            ThreadPoolExecutor(max_workers=1) as db_executor:
+        pending_inserts = deque()
+        # Each PDF holds a slot from being sent to a worker until its insert is done, so parsed
+        # PDFs can't pile up in memory when MySQL is slower than the parsing
+        slots = threading.BoundedSemaphore(MAX_PENDING_INSERTS + os.cpu_count())
+        results = pool.imap_unordered(process_one_pdf, take_slots(pdf_files, slots), chunksize=1)
+        for data, concelho, posto, pdf_path in tqdm(results, total=len(pdf_files), desc="Processing PDFs", unit="file"):
+            submitted = False
+            try:
+                total_entries = len(data["Nome Completo"])
+                logging.info(f"Total extracted entries from {pdf_path}: {total_entries}")
+                if len(pending_inserts) >= MAX_PENDING_INSERTS:
+                    wait_for_insert(*pending_inserts.popleft())
+                pending_inserts.append((db_executor.submit(writer.insert, data), pdf_path, slots))
+                submitted = True
+                logging.info(f"Concelho: {concelho}, Posto: {posto}")
+
+                # Save data to a file if the option is selected
+                if save_to_file and total_entries:
+                    output_file_path = save_data_to_file(data, pdf_path)
+                    logging.info(f'Data extracted and saved to {output_file_path}')
+                else:
+                    logging.info(f"No data extracted from {pdf_path}.")
+            except Exception as e:
+                logging.error(f"Error processing {pdf_path}: {e}")
+            finally:
+                if not submitted:
+                    slots.release()
+
+        # Wait for the remaining inserts so their failures are logged
+        while pending_inserts:
+            wait_for_insert(*pending_inserts.popleft())
 
     # Indicate completion to the user
     print("✅ Processing complete, please check the logs for more information.")